@@ -15,66 +15,110 @@ Or with custom interval:
     SCRAPE_INTERVAL=10 python main.py
 """
 
+import asyncio
 import logging
+import logging.handlers
+import os
+import queue
 import signal
 import sys
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 from src.config import config
+from src.dedup import RedisDedup
 from src.scraper import CLSScraper
 from src.analyzer import NewsAnalyzer
 from src.models import NewsItem, AnalysisResult
 
 
 # Set up logging
-def setup_logging() -> None:
-    """Configure application logging."""
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Configure application logging.
+
+    Log records are handed to an unbounded queue and formatted/written
+    by a background listener thread, so logging in a hot cycle never
+    blocks the event loop on a stdout write.
+
+    Returns:
+        The started queue listener; callers stop it on shutdown.
+    """
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    logging.basicConfig(
-        level=getattr(logging, config.log_level.upper()),
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-        ]
-    )
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(log_format))
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, config.log_level.upper()))
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on analysis calls in flight at once
+MAX_CONCURRENT_ANALYZE = 4
+
+
+@dataclass(slots=True)
+class MonitorStats:
+    """Counters for a monitor run."""
+
+    total_fetches: int = 0
+    new_items: int = 0
+    duplicates: int = 0
+    errors: int = 0
+    start_time: Optional[datetime] = None
+
 
 class CLSNewsMonitor:
     """
     Main monitor class that orchestrates scraping and analysis.
     
     Features:
-    - Continuous monitoring with configurable interval
+    - Continuous async monitoring with configurable interval
     - Graceful shutdown handling
     - Error recovery
     - Statistics tracking
     """
-    
+
+    # Rendered once; every display call reuses the same objects
+    _SEP = "=" * 60
+    _BARS = tuple("★" * i + "☆" * (10 - i) for i in range(11))
+    _SENTIMENT_EMOJI = ("📉", "📈")
+
     def __init__(self):
         """Initialize the monitor."""
         self._running = False
         self._scraper = CLSScraper()
         self._analyzer = NewsAnalyzer()
-        
+        self._analyze_sem: Optional[asyncio.Semaphore] = None
+        self._pending_tasks: set = set()
+        self._news_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._dedup: Optional[RedisDedup] = None
+
         # Statistics
-        self._stats = {
-            "total_fetches": 0,
-            "new_items": 0,
-            "duplicates": 0,
-            "errors": 0,
-            "start_time": None,
-        }
-        
-        # Set up signal handlers
-        signal.signal(signal.SIGINT, self._handle_shutdown)
-        signal.signal(signal.SIGTERM, self._handle_shutdown)
-    
-    def _handle_shutdown(self, signum: int, frame) -> None:
+        self._stats = MonitorStats()
+
+    def _install_signal_handlers(self) -> None:
+        """Register shutdown handlers on the running event loop."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._handle_shutdown)
+            except NotImplementedError:
+                # add_signal_handler is not available on Windows event loops
+                signal.signal(sig, lambda signum, frame: self._handle_shutdown())
+
+    def _handle_shutdown(self) -> None:
         """Handle shutdown signals gracefully."""
         logger.info("Received shutdown signal. Stopping monitor...")
         self._running = False
@@ -82,113 +126,243 @@ class CLSNewsMonitor:
     def _display_result(self, news: NewsItem, result: AnalysisResult) -> None:
         """
         Display the analysis result in a formatted way.
-        
+
+        The whole block is rendered first and emitted with a single
+        buffered write, so a slow terminal costs one syscall per item
+        instead of ten.
+
         Args:
             news: The analyzed news item
             result: The analysis result
         """
-        separator = "=" * 60
-        
-        print(f"\n{separator}")
-        print(f"📰 新闻快讯 | {news.display_time}")
-        print(separator)
-        print(f"内容: {news.content}")
-        
+        lines = [
+            "",
+            self._SEP,
+            f"📰 新闻快讯 | {news.display_time}",
+            self._SEP,
+            f"内容: {news.content}",
+        ]
+
         if news.stocks:
-            print(f"相关股票: {', '.join(news.stocks)}")
+            lines.append(f"相关股票: {', '.join(news.stocks)}")
         if news.subjects:
-            print(f"相关主题: {', '.join(news.subjects)}")
-        
-        print(separator)
-        
-        # Display score with visual indicator
-        score_bar = "★" * result.score + "☆" * (10 - result.score)
-        sentiment_emoji = "📈" if result.is_positive else "📉"
-        
-        print(f"📊 市场热度: {score_bar} ({result.score}/10)")
-        print(f"{sentiment_emoji} 市场影响: {'利好' if result.is_positive else '利空/中性'}")
-        print(f"💡 分析: {result.analysis}")
-        print(f"🎯 市场影响: {result.market_impact}")
-        print(separator)
+            lines.append(f"相关主题: {', '.join(news.subjects)}")
+
+        lines.append(self._SEP)
+
+        # Score with visual indicator
+        score_bar = self._BARS[result.score]
+        sentiment_emoji = self._SENTIMENT_EMOJI[result.is_positive]
+
+        lines.extend([
+            f"📊 市场热度: {score_bar} ({result.score}/10)",
+            f"{sentiment_emoji} 市场影响: {'利好' if result.is_positive else '利空/中性'}",
+            f"💡 分析: {result.analysis}",
+            f"🎯 市场影响: {result.market_impact}",
+        ])
+
+        if result.stock_ratings:
+            lines.append("📌 个股评级:")
+            lines.extend(f"   {rating}" for rating in result.stock_ratings)
+
+        if result.industry_ratings:
+            lines.append("🏭 行业评级:")
+            lines.extend(f"   {rating}" for rating in result.industry_ratings)
+
+        lines.append(self._SEP)
+
+        self._emit("\n".join(lines) + "\n")
+
+    @staticmethod
+    def _emit(rendered: str) -> None:
+        """
+        Write a rendered display block to stdout.
+
+        When stdout is a real terminal the pre-encoded block goes out
+        through a single ``os.write`` on the raw file descriptor,
+        bypassing the TextIOWrapper lock and buffer. For pipes, files
+        and wrapped streams (e.g. under tests) it falls back to the
+        regular buffered write.
+
+        Args:
+            rendered: The fully rendered text block, newline-terminated
+        """
+        try:
+            if sys.stdout.isatty():
+                os.write(sys.stdout.fileno(), rendered.encode("utf-8"))
+                return
+        except (OSError, ValueError, AttributeError):
+            pass
+        sys.stdout.write(rendered)
+        sys.stdout.flush()
     
     def _display_stats(self) -> None:
         """Display current statistics."""
-        if self._stats["start_time"]:
-            runtime = datetime.now() - self._stats["start_time"]
+        if self._stats.start_time:
+            runtime = datetime.now() - self._stats.start_time
             print(f"\n📈 运行统计:")
             print(f"   运行时长: {runtime}")
-            print(f"   总请求次数: {self._stats['total_fetches']}")
-            print(f"   新消息数量: {self._stats['new_items']}")
-            print(f"   重复消息数量: {self._stats['duplicates']}")
-            print(f"   错误次数: {self._stats['errors']}")
+            print(f"   总请求次数: {self._stats.total_fetches}")
+            print(f"   新消息数量: {self._stats.new_items}")
+            print(f"   重复消息数量: {self._stats.duplicates}")
+            print(f"   错误次数: {self._stats.errors}")
+            provider = self._analyzer.provider
+            print(f"   AI缓存命中/未命中: {provider.cache_hits}/{provider.cache_misses}")
+            print(f"   已见消息数(近似): {self._scraper.seen_count}")
     
-    def run(self) -> None:
+    async def run(self) -> None:
         """
         Start the monitoring loop.
-        
-        This method runs continuously until interrupted.
+
+        This coroutine runs continuously until interrupted.
         """
         self._running = True
-        self._stats["start_time"] = datetime.now()
-        
+        self._stats.start_time = datetime.now()
+        self._install_signal_handlers()
+        self._analyze_sem = asyncio.Semaphore(MAX_CONCURRENT_ANALYZE)
+        self._news_queue = asyncio.Queue()
+        self._batch_task = asyncio.create_task(self._batch_worker())
+
+        # Optional shared dedup so multiple replicas analyze each item once
+        if config.redis_url:
+            try:
+                self._dedup = RedisDedup(config.redis_url)
+            except RuntimeError as e:
+                logger.warning(f"Cross-process dedup disabled: {e}")
+
         logger.info(f"Starting CLS News Monitor...")
         logger.info(f"Scrape interval: {config.scrape_interval} seconds")
-        print("\n" + "=" * 60)
+        print("\n" + self._SEP)
         print("🚀 CLS 财联社新闻监控已启动")
         print(f"⏱️  刷新间隔: {config.scrape_interval} 秒")
         print("💡 按 Ctrl+C 停止监控")
-        print("=" * 60 + "\n")
+        print(self._SEP + "\n")
         
+        # Schedule against monotonic ticks so the cadence stays
+        # `interval`, not `interval + work_time`, and does not drift
+        next_tick = time.monotonic()
+
         while self._running:
             try:
-                self._process_cycle()
+                await self._process_cycle()
             except Exception as e:
                 logger.error(f"Error in processing cycle: {e}")
-                self._stats["errors"] += 1
-            
-            # Wait for next cycle
+                self._stats.errors += 1
+
+            # Wait for next cycle without blocking the event loop
             if self._running:
-                time.sleep(config.scrape_interval)
-        
+                next_tick += config.scrape_interval
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for > 0:
+                    await asyncio.sleep(sleep_for)
+                else:
+                    # Work overran the interval; rebase instead of
+                    # firing a catch-up burst
+                    next_tick = time.monotonic()
+
         # Cleanup
-        self._shutdown()
-    
-    def _process_cycle(self) -> None:
+        await self._shutdown()
+
+    async def _process_cycle(self) -> None:
         """Process a single fetch-analyze cycle."""
-        self._stats["total_fetches"] += 1
-        
+        self._stats.total_fetches += 1
+
         # Fetch latest news
-        news = self._scraper.fetch_latest_news()
-        
+        news = await self._scraper.fetch_latest_news_async()
+
         if news is None:
-            self._stats["duplicates"] += 1
+            self._stats.duplicates += 1
             logger.debug("No new news item (duplicate or error)")
             return
-        
-        self._stats["new_items"] += 1
-        
-        # Analyze the news
-        result = self._analyzer.analyze(news)
-        
-        if result:
-            self._display_result(news, result)
-        else:
-            logger.warning(f"Analysis failed for news: {news.id}")
-    
-    def _shutdown(self) -> None:
+
+        # Skip items another replica already claimed
+        if self._dedup and not await self._dedup.is_new(news.id):
+            self._stats.duplicates += 1
+            logger.debug(f"News {news.id} already claimed by another replica")
+            return
+
+        self._stats.new_items += 1
+
+        # Queue for the batch worker so the fetch cadence is not blocked
+        # by a slow AI call
+        await self._news_queue.put(news)
+
+    async def _batch_worker(self) -> None:
+        """
+        Drain queued news items every batch window and analyze them together.
+
+        Accumulating items for a short window lets the analyzer fold
+        several prompts into a single provider call.
+        """
+        while True:
+            await asyncio.sleep(config.batch_window)
+
+            batch = []
+            while not self._news_queue.empty():
+                batch.append(self._news_queue.get_nowait())
+
+            if batch:
+                task = asyncio.create_task(self._analyze_and_display_batch(batch))
+                self._pending_tasks.add(task)
+                task.add_done_callback(self._pending_tasks.discard)
+
+            if not self._running and self._news_queue.empty():
+                break
+
+    async def _analyze_and_display_batch(self, batch: list) -> None:
+        """
+        Analyze a batch of news items and display the results.
+
+        Runs as a background task, bounded by the analyze semaphore so
+        a burst of items cannot overload the AI backend.
+
+        Args:
+            batch: The news items to analyze
+        """
+        async with self._analyze_sem:
+            try:
+                results = await self._analyzer.analyze_batch_async(batch)
+            except Exception as e:
+                logger.error(f"Analysis batch of {len(batch)} item(s) failed: {e}")
+                self._stats.errors += 1
+                return
+
+        for news, result in zip(batch, results):
+            if result:
+                self._display_result(news, result)
+            else:
+                logger.warning(f"Analysis failed for news: {news.id}")
+
+    async def _shutdown(self) -> None:
         """Clean up resources on shutdown."""
         logger.info("Shutting down monitor...")
-        self._scraper.close()
+
+        # Let the batch worker flush any queued items
+        if self._batch_task:
+            await self._batch_task
+
+        # Let in-flight analysis tasks finish before tearing down
+        if self._pending_tasks:
+            logger.info(f"Waiting for {len(self._pending_tasks)} pending analysis task(s)...")
+            await asyncio.gather(*self._pending_tasks, return_exceptions=True)
+
+        if self._dedup:
+            await self._dedup.close()
+
+        await self._scraper.aclose()
         self._display_stats()
         print("\n👋 监控已停止")
 
 
 def main() -> None:
     """Main entry point."""
-    setup_logging()
-    
-    monitor = CLSNewsMonitor()
-    monitor.run()
+    listener = setup_logging()
+
+    try:
+        monitor = CLSNewsMonitor()
+        asyncio.run(monitor.run())
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
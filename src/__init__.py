@@ -4,14 +4,20 @@ Source package initialization.
 
 from .config import Config, config
 from .scraper import CLSScraper
-from .analyzer import NewsAnalyzer
-from .models import NewsItem, AnalysisResult
+from .analyzer import EnhancedAnalyzer, NewsAnalyzer
+from .models import NewsItem, AnalysisResult, IndustryRating, StockRating
+from .ai_providers import AIProvider, create_ai_provider
 
 __all__ = [
     "Config",
     "config",
     "CLSScraper",
+    "EnhancedAnalyzer",
     "NewsAnalyzer",
     "NewsItem",
     "AnalysisResult",
+    "StockRating",
+    "IndustryRating",
+    "AIProvider",
+    "create_ai_provider",
 ]
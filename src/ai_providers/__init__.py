@@ -0,0 +1,29 @@
+"""
+AI provider package initialization.
+
+Provider classes are imported lazily (PEP 562) so that using one backend
+does not pay the import cost and memory of the other's SDK/HTTP stack.
+"""
+
+import importlib
+
+_LAZY_ATTRS = {
+    "AIProvider": ".base",
+    "GitHubCopilotProvider": ".copilot_provider",
+    "QiniuCloudProvider": ".qiniu_provider",
+    "create_ai_provider": ".factory",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    """Resolve exported names on first access."""
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
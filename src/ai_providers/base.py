@@ -0,0 +1,169 @@
+"""
+Base interface for AI analysis providers.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from ..cache import LRUResponseCache
+from ..config import config
+
+
+# Upper bound on concurrent requests in the default batch dispatch
+_MAX_BATCH_WORKERS = 8
+
+
+class AIProvider(ABC):
+    """
+    Abstract base class for AI analysis backends.
+
+    A provider takes a fully built prompt string and returns the raw
+    response text from the model. Parsing the response into an
+    AnalysisResult is the analyzer's job, so providers stay focused on
+    transport and authentication.
+    """
+
+    #: Identifier of the underlying model, used for logging and caching.
+    model_id: str = "unknown"
+
+    #: Whether the backend can be steered into emitting a JSON object.
+    supports_json_output: bool = False
+
+    def __init__(self):
+        """Initialize the shared response cache."""
+        self._response_cache: Optional[LRUResponseCache] = (
+            LRUResponseCache() if config.enable_prompt_cache else None
+        )
+
+    @property
+    @abstractmethod
+    def available(self) -> bool:
+        """Whether the provider is configured and ready to serve requests."""
+
+    @property
+    def cache_hits(self) -> int:
+        """Number of responses served from cache."""
+        return self._response_cache.hits if self._response_cache else 0
+
+    @property
+    def cache_misses(self) -> int:
+        """Number of prompts that required a provider call."""
+        return self._response_cache.misses if self._response_cache else 0
+
+    def analyze(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        json_mode: bool = False,
+    ) -> Optional[str]:
+        """
+        Send a single prompt to the model, with response caching.
+
+        Identical prompts (common for re-broadcast news) are answered
+        from a bounded in-process LRU cache, skipping the network round
+        trip and token cost entirely. Set ENABLE_PROMPT_CACHE=false to
+        bypass the cache.
+
+        Args:
+            prompt: The volatile, per-item prompt content
+            system: Constant instruction preamble, sent as the system
+                message where the backend supports one
+            json_mode: Ask the backend for a JSON object response,
+                where supported
+
+        Returns:
+            The raw response text, or None if the call fails
+        """
+        if self._response_cache is None:
+            return self._analyze_impl(prompt, system, json_mode)
+
+        # json_mode changes the response shape, so it partitions the key space
+        key = LRUResponseCache.make_key(
+            prompt, system, f"{self.model_id}+json" if json_mode else self.model_id
+        )
+
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self._analyze_impl(prompt, system, json_mode)
+
+        if response is not None:
+            self._response_cache.set(key, response)
+
+        return response
+
+    @abstractmethod
+    def _analyze_impl(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        json_mode: bool = False,
+    ) -> Optional[str]:
+        """
+        Send a single prompt to the model (uncached transport path).
+
+        Args:
+            prompt: The volatile, per-item prompt content
+            system: Constant instruction preamble, if any
+            json_mode: Ask the backend for a JSON object response,
+                where supported
+
+        Returns:
+            The raw response text, or None if the call fails
+        """
+
+    async def analyze_async(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        json_mode: bool = False,
+    ) -> Optional[str]:
+        """
+        Async variant of :meth:`analyze`.
+
+        The default runs the blocking call in a worker thread, keeping
+        the cache and retry behavior; providers with a native async
+        client should override this.
+
+        Args:
+            prompt: The volatile, per-item prompt content
+            system: Constant instruction preamble, if any
+            json_mode: Ask the backend for a JSON object response,
+                where supported
+
+        Returns:
+            The raw response text, or None if the call fails
+        """
+        return await asyncio.to_thread(self.analyze, prompt, system, json_mode)
+
+    def analyze_batch(
+        self, prompts: List[str], system: Optional[str] = None
+    ) -> List[Optional[str]]:
+        """
+        Send multiple prompts to the model.
+
+        The default implementation issues one call per prompt, but
+        overlaps them on a thread pool so N requests cost roughly one
+        round trip instead of N. Providers that can answer several
+        prompts in a single server-side call should override this.
+
+        Args:
+            prompts: The prompts to analyze
+            system: Constant instruction preamble shared by all prompts
+
+        Returns:
+            One response (or None) per prompt, in input order
+        """
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self.analyze(prompts[0], system)]
+
+        with ThreadPoolExecutor(max_workers=min(len(prompts), _MAX_BATCH_WORKERS)) as executor:
+            return list(executor.map(lambda prompt: self.analyze(prompt, system), prompts))
+
+    def close(self) -> None:
+        """Release any underlying resources. Optional for providers."""
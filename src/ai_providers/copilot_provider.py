@@ -0,0 +1,87 @@
+"""
+AI provider backed by the GitHub Copilot SDK.
+"""
+
+import logging
+from typing import Optional
+
+from ..config import config
+from .base import AIProvider
+
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubCopilotProvider(AIProvider):
+    """
+    Provider that routes prompts through the GitHub Copilot SDK.
+
+    Requires a GitHub token with Copilot access and the optional
+    ``github-copilot-sdk`` package.
+    """
+
+    model_id = "github-copilot"
+
+    def __init__(self, github_token: Optional[str] = None):
+        """
+        Initialize the Copilot provider.
+
+        Args:
+            github_token: GitHub token with Copilot access
+        """
+        super().__init__()
+        self._token = github_token or config.github_token
+        self._session = None
+        self._initialize_sdk()
+
+    def _initialize_sdk(self) -> None:
+        """Initialize the Copilot SDK session."""
+        if not self._token:
+            logger.warning("No GitHub token provided. Copilot provider unavailable.")
+            return
+
+        try:
+            # Try to import and initialize the Copilot SDK
+            from github_copilot_sdk import CopilotAgentSession
+            self._session = CopilotAgentSession()
+            logger.info("GitHub Copilot SDK initialized successfully")
+        except ImportError:
+            logger.warning(
+                "github-copilot-sdk not installed. "
+                "Install it with: pip install github-copilot-sdk"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to initialize Copilot SDK: {e}")
+
+    @property
+    def available(self) -> bool:
+        """Whether the SDK session was set up successfully."""
+        return self._session is not None
+
+    def _analyze_impl(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        json_mode: bool = False,
+    ) -> Optional[str]:
+        """
+        Send a prompt through the Copilot SDK.
+
+        Args:
+            prompt: The volatile, per-item prompt content
+            system: Constant instruction preamble; the SDK has no
+                system-message slot, so it is prepended to the prompt
+            json_mode: Ignored; the SDK has no structured-output switch
+
+        Returns:
+            The raw response text, or None if the call fails
+        """
+        if self._session is None:
+            return None
+
+        try:
+            response = self._session.ask(f"{system}\n\n{prompt}" if system else prompt)
+            return response.text
+        except Exception as e:
+            logger.error(f"Copilot request failed: {e}")
+            return None
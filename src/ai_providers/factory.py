@@ -0,0 +1,41 @@
+"""
+Factory for constructing AI providers from configuration.
+"""
+
+import logging
+from typing import Optional
+
+from ..config import config
+from .base import AIProvider
+
+
+logger = logging.getLogger(__name__)
+
+
+def create_ai_provider(provider_name: Optional[str] = None, **kwargs) -> AIProvider:
+    """
+    Create an AI provider instance.
+
+    Args:
+        provider_name: Provider to construct ("qiniu" or "copilot");
+            defaults to the configured ``ai_provider``
+        **kwargs: Extra arguments forwarded to the provider constructor
+
+    Returns:
+        The constructed provider
+
+    Raises:
+        ValueError: If the provider name is not recognized
+    """
+    name = (provider_name or config.ai_provider).lower()
+
+    # Import inside the matching branch so only the chosen backend's
+    # dependency stack gets loaded
+    if name == "qiniu":
+        from .qiniu_provider import QiniuCloudProvider
+        return QiniuCloudProvider(**kwargs)
+    if name == "copilot":
+        from .copilot_provider import GitHubCopilotProvider
+        return GitHubCopilotProvider(**kwargs)
+
+    raise ValueError(f"Unknown AI provider: {name}")
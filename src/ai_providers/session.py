@@ -0,0 +1,41 @@
+"""
+Process-wide HTTP client shared by AI providers.
+
+Every provider instance talking HTTP reuses one pooled HTTP/2 client, so
+TLS handshakes are amortized across all outbound requests instead of
+being paid per provider (or per analyzer) instance.
+"""
+
+import atexit
+import threading
+from typing import Optional
+
+import httpx
+
+from ..config import config
+
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_shared_client() -> httpx.Client:
+    """
+    Return the shared HTTP/2 client, creating it on first use.
+
+    The client is closed automatically at interpreter exit.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+                    timeout=config.request_timeout,
+                    headers={"Connection": "keep-alive"},
+                )
+                atexit.register(_client.close)
+
+    return _client
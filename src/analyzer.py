@@ -7,76 +7,237 @@ This module analyzes news items and provides:
 - Market impact assessment
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import os
+import pickle
 import re
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import List, Optional
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from .ai_providers import AIProvider, GitHubCopilotProvider, create_ai_provider
+from .cache import SemanticCache
 from .config import config
-from .models import NewsItem, AnalysisResult
+from .models import NewsItem, AnalysisResult, IndustryRating, StockRating
+
+try:
+    # pyahocorasick collapses all keyword scans in the fallback path
+    # into one linear pass over the content
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 logger = logging.getLogger(__name__)
 
 
-class CopilotAnalyzer:
+# Keyword tables for the heuristic fallback, built once at import as
+# frozensets: O(1) membership and an explicit guarantee that nothing
+# mutates them after the derived regexes/automaton are built
+POSITIVE_KEYWORDS = frozenset({
+    "增长", "上涨", "突破", "利好", "支持", "加速", "扩大",
+    "创新", "盈利", "超预期", "回升", "反弹", "新高",
+})
+
+NEGATIVE_KEYWORDS = frozenset({
+    "下跌", "下降", "亏损", "利空", "风险", "警告", "暴跌",
+    "收缩", "萎缩", "不及预期", "暂停", "终止", "处罚",
+})
+
+HIGH_IMPACT_KEYWORDS = frozenset({
+    "央行", "政策", "降息", "加息", "财政", "重大", "突发",
+    "并购", "重组", "退市", "上市", "国务院", "发改委",
+})
+
+# Industry -> leader stocks; the industry name and every leader act as
+# detection keywords for the fallback's industry ratings
+INDUSTRY_KEYWORDS = {
+    "新能源": ("宁德时代", "比亚迪", "隆基绿能"),
+    "半导体": ("中芯国际", "韦尔股份", "北方华创"),
+    "人工智能": ("科大讯飞", "寒武纪", "海光信息"),
+    "医药": ("恒瑞医药", "药明康德", "迈瑞医疗"),
+    "房地产": ("万科A", "保利发展", "招商蛇口"),
+    "白酒": ("贵州茅台", "五粮液", "泸州老窖"),
+    "银行": ("工商银行", "招商银行", "建设银行"),
+}
+
+# Any industry name or leader stock maps back to its industry
+_IND_KW_TO_INDUSTRY = {
+    kw: industry
+    for industry, leaders in INDUSTRY_KEYWORDS.items()
+    for kw in (industry, *leaders)
+}
+
+
+def _build_keyword_automaton():
     """
-    Analyzer using GitHub Copilot SDK for AI-powered news analysis.
-    
-    This analyzer uses the GitHub Copilot SDK to analyze financial news
-    and provide market sentiment ratings.
+    Build (or load) a single automaton tagging each keyword with its category.
+
+    The built automaton is pickled under ``.cache/`` with the keyword
+    tables' hash in the filename, so short-lived runs load it instead of
+    rebuilding; changing any table changes the hash and invalidates the
+    cached copy. Cache I/O failures silently fall back to a fresh build.
     """
-    
-    def __init__(self, github_token: Optional[str] = None):
-        """
-        Initialize the Copilot analyzer.
-        
-        Args:
-            github_token: GitHub token with Copilot access
-        """
-        self._token = github_token or config.github_token
-        self._session = None
-        self._initialize_sdk()
-    
-    def _initialize_sdk(self) -> None:
-        """Initialize the Copilot SDK session."""
-        if not self._token:
-            logger.warning("No GitHub token provided. Analyzer will use fallback mode.")
-            return
-        
-        try:
-            # Try to import and initialize the Copilot SDK
-            from github_copilot_sdk import CopilotAgentSession
-            self._session = CopilotAgentSession()
-            logger.info("GitHub Copilot SDK initialized successfully")
-        except ImportError:
-            logger.warning(
-                "github-copilot-sdk not installed. "
-                "Install it with: pip install github-copilot-sdk"
-            )
-        except Exception as e:
-            logger.warning(f"Failed to initialize Copilot SDK: {e}")
-    
-    def _build_analysis_prompt(self, news: NewsItem) -> str:
-        """
-        Build the analysis prompt for the AI.
-        
-        Args:
-            news: The news item to analyze
-            
-        Returns:
-            The formatted prompt string
-        """
-        stocks_str = ", ".join(news.stocks) if news.stocks else "无"
-        subjects_str = ", ".join(news.subjects) if news.subjects else "无"
-        
-        prompt = f"""请分析以下财经新闻的市场影响，并给出1-10分的市场热度评分（10分为最高，代表极具市场影响力）。
+    if ahocorasick is None:
+        return None
+
+    # Frozenset iteration order varies between interpreter runs, so
+    # hash over sorted views to keep the cache filename stable
+    tables = repr(
+        (
+            sorted(POSITIVE_KEYWORDS),
+            sorted(NEGATIVE_KEYWORDS),
+            sorted(HIGH_IMPACT_KEYWORDS),
+            INDUSTRY_KEYWORDS,
+        )
+    )
+    digest = hashlib.sha1(tables.encode("utf-8")).hexdigest()[:12]
+    cache_path = os.path.join(".cache", f"kw_automaton_{digest}.pkl")
+
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    automaton = ahocorasick.Automaton()
+    for category, keywords in (
+        ("positive", POSITIVE_KEYWORDS),
+        ("negative", NEGATIVE_KEYWORDS),
+        ("impact", HIGH_IMPACT_KEYWORDS),
+    ):
+        for kw in sorted(keywords):
+            automaton.add_word(kw, (category, kw))
+    for kw, industry in _IND_KW_TO_INDUSTRY.items():
+        automaton.add_word(kw, ("industry", industry))
+    automaton.make_automaton()
 
-新闻内容：
-{news.content}
+    try:
+        os.makedirs(".cache", exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(automaton, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
 
-相关股票：{stocks_str}
-相关主题：{subjects_str}
-发布时间：{news.display_time}
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Regex fallback when pyahocorasick is absent: one C-level alternation
+# scan per category instead of one Python-level scan per keyword
+_POS_RE = re.compile("|".join(map(re.escape, sorted(POSITIVE_KEYWORDS))))
+_NEG_RE = re.compile("|".join(map(re.escape, sorted(NEGATIVE_KEYWORDS))))
+_HI_RE = re.compile("|".join(map(re.escape, sorted(HIGH_IMPACT_KEYWORDS))))
+_IND_RE = re.compile("|".join(map(re.escape, _IND_KW_TO_INDUSTRY)))
+
+
+def _keyword_counts(content: str) -> tuple:
+    """
+    Tally keyword hits per category and hit industries in a single pass.
+
+    Falls back to compiled alternation scans when pyahocorasick is not
+    installed.
+
+    Args:
+        content: The text to scan
+
+    Returns:
+        (positive, negative, impact, industries) where the counts are
+        distinct-keyword hits and industries is the set of industry
+        names with at least one hit
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        seen = set()
+        for _, payload in _KEYWORD_AUTOMATON.iter(content):
+            seen.add(payload)
+        counts = {"positive": 0, "negative": 0, "impact": 0}
+        industries = set()
+        for category, value in seen:
+            if category == "industry":
+                industries.add(value)
+            else:
+                counts[category] += 1
+        return counts["positive"], counts["negative"], counts["impact"], industries
+
+    # Dedup via set() so repeated occurrences still count once,
+    # matching the automaton path above
+    return (
+        len(set(_POS_RE.findall(content))),
+        len(set(_NEG_RE.findall(content))),
+        len(set(_HI_RE.findall(content))),
+        {_IND_KW_TO_INDUSTRY[kw] for kw in set(_IND_RE.findall(content))},
+    )
+
+
+# Compiled once at import; the parse path runs per news item and
+# should not pay re-cache lookups on every call
+_SCORE_RE = re.compile(r"评分[：:]\s*(\d+)")
+_IMPACT_RE = re.compile(r"市场影响[：:]\s*(.+?)(?:\n|$)")
+_ANALYSIS_RE = re.compile(r"分析[：:]\s*(.+?)(?:\n|$)")
+_STOCK_LINE_RE = re.compile(
+    r"^[\-\*]\s*(?P<name>[^:：\n]+)[：:]\s*(?P<sent>利好|利空)"
+    r"\s*(?P<score>\d+)\s*/\s*10\s*\|\s*(?P<reason>.+)$",
+    re.MULTILINE,
+)
+# All five industry-block fields in one scan instead of one search each
+_IND_BLOCK_RE = re.compile(
+    r"行业名称[：:]\s*(?P<name>.+?)\s*\n"
+    r".*?影响方向[：:]\s*(?P<dir>利好|利空)"
+    r".*?评分[：:]\s*(?P<score>\d+)/10"
+    r".*?龙头股票[：:]\s*(?P<leaders>.+?)\n"
+    r".*?第一性原理分析[：:]\s*(?P<reason>.+?)(?:\n\n|$)",
+    re.DOTALL,
+)
+_SPLIT_RE = re.compile(r"[,，、]")
+# Models that wrap JSON in a markdown fence despite json_mode
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+def _clamp_1_10(x: int) -> int:
+    """Clamp a score into 1-10 without the max()/min() call overhead."""
+    return 1 if x < 1 else 10 if x > 10 else x
+
+
+def _score_from_counts(positive: int, negative: int, impact: int) -> tuple:
+    """
+    Turn keyword hit counts into a (score, is_positive) pair.
+
+    Kept as a pure integer kernel so it stays JIT-compilable; string
+    work lives with the callers.
+    """
+    score = 5 + (positive - negative) + impact * 2
+    if score < 1:
+        score = 1
+    elif score > 10:
+        score = 10
+    return score, positive > negative
+
+
+try:
+    # Batch replays over historical items benefit from compiling the
+    # scoring kernel; cache=True amortizes the compile across runs
+    from numba import njit
+
+    _score_from_counts = njit(cache=True)(_score_from_counts)
+except ImportError:
+    pass
+
+
+# Constant instruction preamble, sent once as the system message so only
+# the per-item content travels in each user message
+_ANALYSIS_SYSTEM_PROMPT = """你是一名财经新闻分析师。请分析用户提供的财经新闻的市场影响，并给出1-10分的市场热度评分（10分为最高，代表极具市场影响力）。
 
 请按以下格式回复：
 评分：[1-10的整数]
@@ -87,46 +248,271 @@ class CopilotAnalyzer:
 注意：
 - 只有重大政策变化、行业突破性进展、重要经济数据等才能给9-10分
 - 普通行业新闻给4-6分
-- 无实质性影响的新闻给1-3分
+- 无实质性影响的新闻给1-3分"""
+
+
+# Variant for backends with structured output: one orjson.loads replaces
+# the regex parsing pipeline
+_ANALYSIS_SYSTEM_PROMPT_JSON = """你是一名财经新闻分析师。请分析用户提供的财经新闻的市场影响，并给出1-10分的市场热度评分（10分为最高，代表极具市场影响力）。
+
+只输出一个JSON对象，不要输出任何其他内容，结构如下：
+{"score": 1-10的整数, "is_positive": true/false, "analysis": "简短分析，不超过100字", "market_impact": "对市场的具体影响描述", "stock_ratings": [{"stock_name": "股票名", "is_positive": true/false, "score": 1-10的整数, "reason": "简短理由"}], "industry_ratings": [{"industry_name": "行业名", "is_positive": true/false, "score": 1-10的整数, "leader_stocks": ["股票1", "股票2"], "reason": "简短分析"}]}
+
+没有相关股票或行业时对应数组留空。注意：
+- 只有重大政策变化、行业突破性进展、重要经济数据等才能给9-10分
+- 普通行业新闻给4-6分
+- 无实质性影响的新闻给1-3分"""
+
+
+# Prompt fragments built once; per item we only run a single format_map
+# instead of recomposing the template strings
+_MAIN_PROMPT_TEMPLATE = """新闻内容：
+{content}
+
+{stock_section}{industry_section}发布时间：{display_time}
 """
-        return prompt
+
+_STOCK_SECTION_TEMPLATE = """相关股票：{stocks_str}
+请同时对每只相关股票单独评级，每只一行，格式：
+- 股票名称：利好/利空 评分/10 | 简短理由
+"""
+_INDUSTRY_SECTION_TEMPLATE = """相关主题：{subjects_str}
+这是一条行业层面的消息，请补充输出行业评级，格式：
+行业名称：[行业名]
+影响方向：[利好/利空]
+评分：[1-10的整数]/10
+龙头股票：[股票1、股票2、股票3]
+第一性原理分析：[简短分析]
+"""
+_SUBJECTS_LINE_TEMPLATE = "相关主题：{subjects_str}\n"
+_STOCK_SECTION_EMPTY = ""
+_INDUSTRY_SECTION_EMPTY = ""
+
+
+@functools.lru_cache(maxsize=None)
+def _default_provider() -> AIProvider:
+    """
+    Build the configured provider once and share it across analyzers.
+
+    Sharing keeps all analyzers on the same pooled HTTP connections and
+    response cache instead of paying a fresh setup per instance.
+    """
+    return create_ai_provider()
+
+
+class EnhancedAnalyzer:
+    """
+    Analyzer using an AI provider for AI-powered news analysis.
+
+    Prompts are routed through a pluggable AIProvider backend; when no
+    backend is available the analyzer falls back to keyword heuristics.
+    """
+
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        provider: Optional[AIProvider] = None,
+    ):
+        """
+        Initialize the analyzer.
+
+        Args:
+            github_token: GitHub token with Copilot access (legacy shortcut
+                for the Copilot provider)
+            provider: AI provider backend; defaults to the configured one
+        """
+        if provider is not None:
+            self._provider = provider
+        elif github_token:
+            self._provider = GitHubCopilotProvider(github_token)
+        else:
+            self._provider = _default_provider()
+
+        if not self._provider.available:
+            logger.warning("AI provider unavailable. Analyzer will use fallback mode.")
+
+        # Semantic layer over the provider's exact-match cache; catches
+        # rephrased re-broadcasts. Only active when the optional
+        # embedding stack is installed.
+        self._semantic_cache: Optional[SemanticCache] = None
+        if config.enable_prompt_cache:
+            try:
+                self._semantic_cache = SemanticCache()
+            except RuntimeError:
+                logger.debug(
+                    "Semantic cache unavailable "
+                    "(sentence-transformers/faiss not installed)"
+                )
+
+    @property
+    def provider(self) -> AIProvider:
+        """The AI provider backend in use."""
+        return self._provider
+
+    def _build_analysis_prompt(self, news: NewsItem) -> str:
+        """
+        Build the volatile, per-item part of the analysis prompt.
+
+        The constant instructions live in _ANALYSIS_SYSTEM_PROMPT and are
+        passed separately as the system message.
+
+        Args:
+            news: The news item to analyze
+
+        Returns:
+            The formatted prompt string
+        """
+        if news.has_specific_stocks:
+            stock_section = _STOCK_SECTION_TEMPLATE.format_map(
+                {"stocks_str": ", ".join(news.stocks)}
+            )
+        else:
+            stock_section = _STOCK_SECTION_EMPTY
+
+        if news.is_industry_event:
+            industry_section = _INDUSTRY_SECTION_TEMPLATE.format_map(
+                {"subjects_str": ", ".join(news.subjects)}
+            )
+        elif news.subjects:
+            industry_section = _SUBJECTS_LINE_TEMPLATE.format_map(
+                {"subjects_str": ", ".join(news.subjects)}
+            )
+        else:
+            industry_section = _INDUSTRY_SECTION_EMPTY
+
+        return _MAIN_PROMPT_TEMPLATE.format_map({
+            "content": news.content,
+            "stock_section": stock_section,
+            "industry_section": industry_section,
+            "display_time": news.display_time,
+        })
     
     def analyze(self, news: NewsItem) -> Optional[AnalysisResult]:
         """
-        Analyze a news item using Copilot.
-        
+        Analyze a news item using the AI provider.
+
         Args:
             news: The news item to analyze
-            
+
         Returns:
             AnalysisResult or None if analysis fails
         """
-        if self._session:
-            return self._analyze_with_copilot(news)
+        if self._provider.available:
+            return self._analyze_with_ai(news)
         else:
             return self._analyze_fallback(news)
-    
-    def _analyze_with_copilot(self, news: NewsItem) -> Optional[AnalysisResult]:
+
+    def analyze_batch(self, news_items: List[NewsItem]) -> List[Optional[AnalysisResult]]:
         """
-        Analyze using the Copilot SDK.
-        
+        Analyze multiple news items in as few provider calls as possible.
+
+        Args:
+            news_items: The news items to analyze
+
+        Returns:
+            One AnalysisResult (or None) per item, in input order
+        """
+        if not news_items:
+            return []
+
+        if not self._provider.available:
+            return [self._analyze_fallback(news) for news in news_items]
+
+        prompts = [self._build_analysis_prompt(news) for news in news_items]
+        responses = self._provider.analyze_batch(prompts, system=_ANALYSIS_SYSTEM_PROMPT)
+
+        results: List[Optional[AnalysisResult]] = []
+        for news, response_text in zip(news_items, responses):
+            if response_text is None:
+                results.append(self._analyze_fallback(news))
+            else:
+                parsed = self._parse_analysis_response(news.id, response_text)
+                results.append(parsed or self._analyze_fallback(news))
+        return results
+
+    async def analyze_many(
+        self,
+        news_items: List[NewsItem],
+        max_concurrency: int = 16,
+    ) -> List[Optional[AnalysisResult]]:
+        """
+        Analyze multiple news items with overlapped provider calls.
+
+        Fans the items out via asyncio.gather under a bounded
+        semaphore, so N items cost roughly one round trip instead of N
+        while the backend is never hit by more than ``max_concurrency``
+        requests at once.
+
+        Args:
+            news_items: The news items to analyze
+            max_concurrency: Upper bound on in-flight provider calls
+
+        Returns:
+            One AnalysisResult (or None) per item, in input order
+        """
+        if not news_items:
+            return []
+
+        if not self._provider.available:
+            return [self._analyze_fallback(news) for news in news_items]
+
+        sem = asyncio.Semaphore(max_concurrency)
+
+        json_mode = self._provider.supports_json_output
+        system = _ANALYSIS_SYSTEM_PROMPT_JSON if json_mode else _ANALYSIS_SYSTEM_PROMPT
+
+        async def one(news: NewsItem) -> Optional[AnalysisResult]:
+            prompt = self._build_analysis_prompt(news)
+            async with sem:
+                response_text = await self._provider.analyze_async(
+                    prompt, system=system, json_mode=json_mode
+                )
+            if response_text is None:
+                return self._analyze_fallback(news)
+            parsed = self._parse_response(news.id, response_text)
+            return parsed or self._analyze_fallback(news)
+
+        return list(await asyncio.gather(*(one(news) for news in news_items)))
+
+    def _analyze_with_ai(self, news: NewsItem) -> Optional[AnalysisResult]:
+        """
+        Analyze using the AI provider.
+
         Args:
             news: The news item to analyze
-            
+
         Returns:
             AnalysisResult or None if analysis fails
         """
         try:
+            # Exact-match caching happens inside the provider; the
+            # semantic layer here additionally catches rephrasings
+            if self._semantic_cache is not None:
+                cached = self._semantic_cache.get(news.content)
+                if cached is not None:
+                    return replace(cached, news_id=news.id)
+
             prompt = self._build_analysis_prompt(news)
-            response = self._session.ask(prompt)
-            
+            json_mode = self._provider.supports_json_output
+            response_text = self._provider.analyze(
+                prompt,
+                system=_ANALYSIS_SYSTEM_PROMPT_JSON if json_mode else _ANALYSIS_SYSTEM_PROMPT,
+                json_mode=json_mode,
+            )
+
+            if response_text is None:
+                return self._analyze_fallback(news)
+
             # Parse the response
-            return self._parse_analysis_response(news.id, response.text)
-            
+            result = self._parse_response(news.id, response_text)
+            if result is not None and self._semantic_cache is not None:
+                self._semantic_cache.set(news.content, result)
+            return result
+
         except Exception as e:
-            logger.error(f"Copilot analysis failed: {e}")
+            logger.error(f"AI analysis failed: {e}")
             return self._analyze_fallback(news)
-    
+
     def _parse_analysis_response(self, news_id: str, response_text: str) -> Optional[AnalysisResult]:
         """
         Parse the AI response into an AnalysisResult.
@@ -140,19 +526,21 @@ class CopilotAnalyzer:
         """
         try:
             # Extract score
-            score_match = re.search(r"评分[：:]\s*(\d+)", response_text)
-            score = int(score_match.group(1)) if score_match else 5
-            score = max(1, min(10, score))  # Clamp to 1-10
-            
-            # Extract impact direction
-            is_positive = "利好" in response_text
-            
+            score_match = _SCORE_RE.search(response_text)
+            score = _clamp_1_10(int(score_match.group(1))) if score_match else 5
+
+            # Extract impact direction from the head only; the format
+            # places the 影响 line near the top, so scanning the multi-KB
+            # tail is wasted work
+            head = response_text[:256]
+            is_positive = "利好" in head
+
             # Extract market impact
-            impact_match = re.search(r"市场影响[：:]\s*(.+?)(?:\n|$)", response_text)
+            impact_match = _IMPACT_RE.search(response_text)
             market_impact = impact_match.group(1).strip() if impact_match else "暂无详细分析"
-            
+
             # Extract analysis
-            analysis_match = re.search(r"分析[：:]\s*(.+?)(?:\n|$)", response_text)
+            analysis_match = _ANALYSIS_RE.search(response_text)
             analysis = analysis_match.group(1).strip() if analysis_match else response_text[:200]
             
             return AnalysisResult(
@@ -161,11 +549,153 @@ class CopilotAnalyzer:
                 analysis=analysis,
                 is_positive=is_positive,
                 market_impact=market_impact,
+                stock_ratings=self._parse_stock_ratings(response_text) or None,
+                industry_ratings=self._parse_industry_ratings(response_text) or None,
             )
-            
+
         except Exception as e:
             logger.error(f"Failed to parse analysis response: {e}")
             return None
+
+    @staticmethod
+    def _parse_stock_ratings(response_text: str) -> List[StockRating]:
+        """
+        Extract per-stock rating lines from the AI response.
+
+        Built as a single finditer comprehension: the digit-validated
+        score group cannot raise on int(), so no per-match try/except
+        is needed.
+
+        Args:
+            response_text: The raw response from the AI
+
+        Returns:
+            One StockRating per matched line, possibly empty
+        """
+        return [
+            StockRating(
+                stock_name=m["name"].strip(),
+                is_positive=m["sent"] == "利好",
+                score=_clamp_1_10(int(m["score"])),
+                reason=m["reason"].strip()[:100],
+            )
+            for m in _STOCK_LINE_RE.finditer(response_text)
+        ]
+
+    @staticmethod
+    def _parse_industry_ratings(response_text: str) -> List[IndustryRating]:
+        """
+        Extract the industry rating block from the AI response.
+
+        The cheap anchor check (`find("行业")`) runs first so responses
+        without an industry block skip the regex entirely, and all five
+        fields come out of a single combined search over the tail.
+
+        Args:
+            response_text: The raw response from the AI
+
+        Returns:
+            A list with the matched IndustryRating, or an empty list
+        """
+        anchor = response_text.find("行业")
+        if anchor < 0:
+            return []
+
+        m = _IND_BLOCK_RE.search(response_text, anchor)
+        if m is None:
+            return []
+
+        leaders = [s.strip() for s in _SPLIT_RE.split(m.group("leaders")) if s.strip()]
+        return [
+            IndustryRating(
+                industry_name=m.group("name").strip(),
+                is_positive=m.group("dir") == "利好",
+                score=_clamp_1_10(int(m.group("score"))),
+                leader_stocks=leaders,
+                reason=m.group("reason").strip()[:100],
+            )
+        ]
+
+    def _parse_analysis_json(self, news_id: str, response_text: str) -> Optional[AnalysisResult]:
+        """
+        Parse a structured JSON response into an AnalysisResult.
+
+        Tries a direct parse first, then a fenced ```json block; the
+        caller falls back to the regex parser if both fail.
+
+        Args:
+            news_id: The ID of the analyzed news
+            response_text: The raw response from the AI
+
+        Returns:
+            AnalysisResult or None if the response is not usable JSON
+        """
+        try:
+            data = _json_loads(response_text)
+        except ValueError:
+            m = _JSON_FENCE_RE.search(response_text)
+            if m is None:
+                return None
+            try:
+                data = _json_loads(m.group(1))
+            except ValueError:
+                return None
+
+        if not isinstance(data, dict):
+            return None
+
+        try:
+            stock_ratings = [
+                StockRating(
+                    stock_name=str(r["stock_name"]),
+                    is_positive=bool(r["is_positive"]),
+                    score=_clamp_1_10(int(r["score"])),
+                    reason=str(r.get("reason", ""))[:100],
+                )
+                for r in data.get("stock_ratings") or []
+            ]
+            industry_ratings = [
+                IndustryRating(
+                    industry_name=str(r["industry_name"]),
+                    is_positive=bool(r["is_positive"]),
+                    score=_clamp_1_10(int(r["score"])),
+                    leader_stocks=[str(s) for s in r.get("leader_stocks") or []],
+                    reason=str(r.get("reason", ""))[:100],
+                )
+                for r in data.get("industry_ratings") or []
+            ]
+            return AnalysisResult(
+                news_id=news_id,
+                score=_clamp_1_10(int(data["score"])),
+                analysis=str(data.get("analysis", "")),
+                is_positive=bool(data.get("is_positive", False)),
+                market_impact=str(data.get("market_impact", "暂无详细分析")),
+                stock_ratings=stock_ratings or None,
+                industry_ratings=industry_ratings or None,
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"Malformed JSON analysis response: {e}")
+            return None
+
+    def _parse_response(self, news_id: str, response_text: str) -> Optional[AnalysisResult]:
+        """
+        Parse a response using the best available strategy.
+
+        JSON-capable backends get the direct-parse path; the regex
+        parser remains the last resort for free-form text.
+
+        Args:
+            news_id: The ID of the analyzed news
+            response_text: The raw response from the AI
+
+        Returns:
+            AnalysisResult or None if parsing fails
+        """
+        if self._provider.supports_json_output:
+            result = self._parse_analysis_json(news_id, response_text)
+            if result is not None:
+                return result
+        return self._parse_analysis_response(news_id, response_text)
     
     def _analyze_fallback(self, news: NewsItem) -> AnalysisResult:
         """
@@ -179,39 +709,17 @@ class CopilotAnalyzer:
         Returns:
             AnalysisResult based on keyword analysis
         """
-        content = news.content.lower()
-        
-        # Positive keywords
-        positive_keywords = [
-            "增长", "上涨", "突破", "利好", "支持", "加速", "扩大",
-            "创新", "盈利", "超预期", "回升", "反弹", "新高",
-        ]
-        
-        # Negative keywords
-        negative_keywords = [
-            "下跌", "下降", "亏损", "利空", "风险", "警告", "暴跌",
-            "收缩", "萎缩", "不及预期", "暂停", "终止", "处罚",
-        ]
-        
-        # High impact keywords
-        high_impact_keywords = [
-            "央行", "政策", "降息", "加息", "财政", "重大", "突发",
-            "并购", "重组", "退市", "上市", "国务院", "发改委",
-        ]
-        
-        # Calculate scores
-        positive_score = sum(1 for kw in positive_keywords if kw in content)
-        negative_score = sum(1 for kw in negative_keywords if kw in content)
-        impact_score = sum(2 for kw in high_impact_keywords if kw in content)
-        
-        # Determine sentiment
-        is_positive = positive_score > negative_score
-        
-        # Calculate final score (1-10)
-        base_score = 5
-        sentiment_modifier = positive_score - negative_score
-        score = base_score + sentiment_modifier + impact_score
-        score = max(1, min(10, score))
+        # All keyword tables are Chinese, so lowercasing the content
+        # would be a full-length copy that changes nothing
+        content = news.content
+
+        # Calculate scores from a single pass over the content
+        positive_score, negative_score, impact_hits, industries = _keyword_counts(content)
+
+        # Final score (1-10) and sentiment from the integer kernel
+        score, is_positive = _score_from_counts(
+            positive_score, negative_score, impact_hits
+        )
         
         # Generate analysis
         if is_positive:
@@ -222,32 +730,58 @@ class CopilotAnalyzer:
             market_impact = "可能对相关板块形成负面影响" if negative_score > 0 else "影响有限"
         
         analysis = f"基于关键词分析，该新闻{sentiment}信号明显" if (positive_score + negative_score) > 0 else "该新闻影响较为中性"
-        
+
+        industry_ratings = [
+            IndustryRating(
+                industry_name=industry,
+                is_positive=is_positive,
+                score=score,
+                leader_stocks=list(INDUSTRY_KEYWORDS[industry]),
+                reason=f"基于第一性原理，{industry}行业的核心价值在于技术壁垒和市场份额",
+            )
+            for industry in industries
+        ]
+
         return AnalysisResult(
             news_id=news.id,
             score=score,
             analysis=analysis,
             is_positive=is_positive,
             market_impact=market_impact,
+            industry_ratings=industry_ratings or None,
         )
 
 
+class CopilotAnalyzer(EnhancedAnalyzer):
+    """Backward-compatible alias for :class:`EnhancedAnalyzer`."""
+
+
 class NewsAnalyzer:
     """
     Main analyzer class that provides a unified interface.
-    
-    Uses CopilotAnalyzer internally but can be extended to support
+
+    Uses EnhancedAnalyzer internally but can be extended to support
     multiple analysis backends.
     """
-    
-    def __init__(self, github_token: Optional[str] = None):
+
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        provider: Optional[AIProvider] = None,
+    ):
         """
         Initialize the news analyzer.
-        
+
         Args:
             github_token: GitHub token for Copilot access
+            provider: AI provider backend; defaults to the configured one
         """
-        self._copilot = CopilotAnalyzer(github_token)
+        self._copilot = EnhancedAnalyzer(github_token, provider=provider)
+
+    @property
+    def provider(self) -> AIProvider:
+        """The AI provider backend in use."""
+        return self._copilot.provider
     
     def analyze(self, news: NewsItem) -> Optional[AnalysisResult]:
         """
@@ -261,8 +795,79 @@ class NewsAnalyzer:
         """
         logger.info(f"Analyzing news: {news.id}")
         result = self._copilot.analyze(news)
-        
+
         if result:
             logger.info(f"Analysis complete: {result}")
-        
+
         return result
+
+    def analyze_batch(self, news_items: List[NewsItem]) -> List[Optional[AnalysisResult]]:
+        """
+        Analyze multiple news items, batching provider calls when possible.
+
+        Args:
+            news_items: The news items to analyze
+
+        Returns:
+            One AnalysisResult (or None) per item, in input order
+        """
+        logger.info(f"Analyzing batch of {len(news_items)} news item(s)")
+        return self._copilot.analyze_batch(news_items)
+
+    def analyze_many(
+        self,
+        news_items: List[NewsItem],
+        max_workers: int = 8,
+    ) -> List[Optional[AnalysisResult]]:
+        """
+        Analyze multiple news items on a thread pool.
+
+        Provider calls wait in C-level socket I/O, so threads overlap
+        them despite the GIL. When no provider is available the
+        fallback runs single-threaded — it is pure CPU and executor
+        dispatch would only add overhead.
+
+        Args:
+            news_items: The news items to analyze
+            max_workers: Upper bound on concurrent provider calls
+
+        Returns:
+            One AnalysisResult (or None) per item, in input order
+        """
+        if not news_items:
+            return []
+
+        if not self.provider.available:
+            return [self._copilot._analyze_fallback(news) for news in news_items]
+
+        with ThreadPoolExecutor(max_workers=min(len(news_items), max_workers)) as executor:
+            return list(executor.map(self.analyze, news_items))
+
+    async def analyze_async(self, news: NewsItem) -> Optional[AnalysisResult]:
+        """
+        Async variant of :meth:`analyze`.
+
+        The blocking AI call runs in a worker thread so the event loop
+        stays responsive while the analysis is in flight.
+
+        Args:
+            news: The news item to analyze
+
+        Returns:
+            AnalysisResult or None if analysis fails
+        """
+        return await asyncio.to_thread(self.analyze, news)
+
+    async def analyze_batch_async(
+        self, news_items: List[NewsItem]
+    ) -> List[Optional[AnalysisResult]]:
+        """
+        Async variant of :meth:`analyze_batch`.
+
+        Args:
+            news_items: The news items to analyze
+
+        Returns:
+            One AnalysisResult (or None) per item, in input order
+        """
+        return await asyncio.to_thread(self.analyze_batch, news_items)
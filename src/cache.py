@@ -0,0 +1,187 @@
+"""
+Response caching for AI provider calls.
+
+CLS frequently re-broadcasts near-identical lines; caching the raw
+model response per prompt skips the network round trip and token cost
+for every repeat.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+try:
+    # Optional semantic layer: catches rephrased duplicates the exact
+    # cache misses (e.g. "央行降息25bp" vs "央行宣布下调利率")
+    import faiss
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    faiss = None
+    SentenceTransformer = None
+
+
+class LRUResponseCache:
+    """
+    Thread-safe, bounded LRU cache with per-entry expiry.
+
+    Keys are compact digests built via :meth:`make_key`, so arbitrarily
+    large prompts cost 16 bytes each in the key space. Entries expire
+    after ``ttl`` seconds; stale ones are dropped on access.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 24 * 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before LRU eviction
+            ttl: Entry lifetime in seconds
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(prompt: str, system: Optional[str] = None, model_id: str = "") -> bytes:
+        """
+        Build a compact cache key.
+
+        The key covers the model identifier and the system message as
+        well as the normalized prompt, so different backends or
+        instruction sets never share entries.
+
+        Args:
+            prompt: The volatile, per-item prompt content
+            system: Constant instruction preamble, if any
+            model_id: Identifier of the serving model
+
+        Returns:
+            A 16-byte digest
+        """
+        normalized = f"{model_id}\x00{system or ''}\x00{prompt.strip().lower()}"
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key built by :meth:`make_key`
+
+        Returns:
+            The cached response, or None on miss or expiry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: bytes, value: str) -> None:
+        """
+        Store a response, evicting the least recently used entry if full.
+
+        Args:
+            key: Key built by :meth:`make_key`
+            value: The raw response text to cache
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self._ttl)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticCache:
+    """
+    Similarity cache over sentence embeddings.
+
+    Looks up previously analyzed content by cosine similarity, so
+    rephrasings of the same story hit the cache even though their text
+    differs. Requires the optional ``sentence-transformers`` and
+    ``faiss`` packages; construction raises if they are missing.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "paraphrase-multilingual-MiniLM-L12-v2",
+        threshold: float = 0.93,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            model_name: Sentence-transformer model to embed with
+            threshold: Minimum cosine similarity to count as a hit
+
+        Raises:
+            RuntimeError: If sentence-transformers or faiss is not installed
+        """
+        if faiss is None or SentenceTransformer is None:
+            raise RuntimeError(
+                "Semantic caching requires the sentence-transformers and "
+                "faiss packages. Install them with: "
+                "pip install sentence-transformers faiss-cpu"
+            )
+        self._model = SentenceTransformer(model_name)
+        self._threshold = threshold
+        self._index = None
+        self._values: List[Any] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _embed(self, text: str):
+        """Embed text as a normalized vector (inner product = cosine)."""
+        return self._model.encode([text], normalize_embeddings=True)
+
+    def get(self, text: str) -> Optional[Any]:
+        """
+        Look up the stored value for the most similar cached text.
+
+        Args:
+            text: The content to look up
+
+        Returns:
+            The cached value, or None if nothing is similar enough
+        """
+        vec = self._embed(text)
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                self.misses += 1
+                return None
+            scores, indices = self._index.search(vec, 1)
+            if scores[0][0] >= self._threshold:
+                self.hits += 1
+                return self._values[indices[0][0]]
+            self.misses += 1
+            return None
+
+    def set(self, text: str, value: Any) -> None:
+        """
+        Store a value under the embedding of its source text.
+
+        Args:
+            text: The content the value was derived from
+            value: The value to cache
+        """
+        vec = self._embed(text)
+        with self._lock:
+            if self._index is None:
+                self._index = faiss.IndexFlatIP(vec.shape[1])
+            self._index.add(vec)
+            self._values.append(value)
@@ -2,6 +2,7 @@
 Configuration management for CLS News Scraper and Analyzer.
 """
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
@@ -13,14 +14,27 @@ from dotenv import load_dotenv
 class Config:
     """Application configuration."""
     
-    # GitHub Copilot settings
+    # AI provider settings
+    ai_provider: str = "copilot"  # "copilot" or "qiniu"
     github_token: Optional[str] = None
-    
+    qiniu_api_key: Optional[str] = None
+    qiniu_api_url: str = "https://openai.qiniu.com/v1/chat/completions"
+    qiniu_model: str = "deepseek-v3"
+
     # Scraper settings
     scrape_interval: int = 5  # seconds
     fetch_count: int = 1
     request_timeout: int = 10
     max_retries: int = 3
+
+    # Analysis batching
+    batch_window: float = 2.0  # seconds to accumulate items per LLM call
+
+    # Prompt/response caching
+    enable_prompt_cache: bool = True
+
+    # Cross-process dedup (optional, for multi-replica setups)
+    redis_url: Optional[str] = None
     
     # Logging
     log_level: str = "INFO"
@@ -35,16 +49,47 @@ class Config:
     def from_env(cls) -> "Config":
         """Load configuration from environment variables."""
         load_dotenv()
-        
+        getenv = os.getenv
+
         return cls(
-            github_token=os.getenv("GITHUB_TOKEN"),
-            scrape_interval=int(os.getenv("SCRAPE_INTERVAL", "5")),
-            fetch_count=int(os.getenv("FETCH_COUNT", "1")),
-            request_timeout=int(os.getenv("REQUEST_TIMEOUT", "10")),
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
+            ai_provider=getenv("AI_PROVIDER", "copilot"),
+            github_token=getenv("GITHUB_TOKEN"),
+            qiniu_api_key=getenv("QINIU_API_KEY"),
+            qiniu_model=getenv("QINIU_MODEL", "deepseek-v3"),
+            scrape_interval=int(getenv("SCRAPE_INTERVAL", "5")),
+            fetch_count=int(getenv("FETCH_COUNT", "1")),
+            request_timeout=int(getenv("REQUEST_TIMEOUT", "10")),
+            max_retries=int(getenv("MAX_RETRIES", "3")),
+            batch_window=float(getenv("BATCH_WINDOW", "2.0")),
+            enable_prompt_cache=getenv("ENABLE_PROMPT_CACHE", "true").lower() != "false",
+            redis_url=getenv("REDIS_URL"),
+            log_level=getenv("LOG_LEVEL", "INFO"),
         )
 
 
-# Global configuration instance
-config = Config.from_env()
+@functools.cache
+def get_config() -> Config:
+    """Build the configuration on first use and reuse it afterwards."""
+    return Config.from_env()
+
+
+class _ConfigProxy:
+    """
+    Lazy stand-in for the global configuration instance.
+
+    `from .config import config` binds this proxy at import time;
+    loading `.env` and parsing environment variables is deferred to the
+    first attribute access, keeping disk I/O off the import path.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        return getattr(get_config(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_config())
+
+
+# Global configuration instance (materialized lazily)
+config = _ConfigProxy()
@@ -0,0 +1,129 @@
+"""
+Duplicate detection helpers for long-running monitors.
+
+Provides a fixed-size Bloom filter so a monitor that runs for days keeps
+constant memory instead of growing an unbounded set of seen news IDs.
+"""
+
+import hashlib
+import math
+from typing import Iterator
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string items.
+
+    Membership tests are O(1) with a bounded false-positive rate and no
+    false negatives: ``in`` may rarely report an unseen item as seen
+    (skipping it), but never the other way around, which is the safe
+    direction for duplicate suppression.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        """
+        Initialize the filter.
+
+        Args:
+            capacity: Expected number of distinct items
+            error_rate: Target false-positive probability at capacity
+        """
+        # Standard optimal sizing: m = -n*ln(p)/ln(2)^2, k = m/n*ln(2)
+        self._num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+        self._count = 0
+
+    def _bit_positions(self, item: str) -> Iterator[int]:
+        """Yield the bit positions for an item via double hashing."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
+
+    def __contains__(self, item: str) -> bool:
+        """Whether the item was (probably) added before."""
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7))
+            for pos in self._bit_positions(item)
+        )
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item to the filter.
+
+        Args:
+            item: The item to remember
+
+        Returns:
+            True if the item was new, False if it was (probably) present
+        """
+        new = False
+        for pos in self._bit_positions(item):
+            mask = 1 << (pos & 7)
+            if not self._bits[pos >> 3] & mask:
+                self._bits[pos >> 3] |= mask
+                new = True
+        if new:
+            self._count += 1
+        return new
+
+    def approximate_count(self) -> int:
+        """Approximate number of distinct items added."""
+        return self._count
+
+
+class RedisDedup:
+    """
+    Cross-process duplicate detection backed by Redis.
+
+    When several monitor replicas scrape the same feed, each keeps its
+    own in-memory state and the same item gets analyzed N times. This
+    class shares the seen-ID set through Redis: ``SADD`` returns 1 only
+    for the first replica to record an ID, so exactly one of them runs
+    the (expensive) analysis.
+    """
+
+    def __init__(self, redis_url: str, key: str = "cls:seen", ttl: int = 7 * 24 * 3600):
+        """
+        Initialize the Redis-backed deduplicator.
+
+        Args:
+            redis_url: Redis connection URL (e.g. redis://localhost:6379/0)
+            key: Redis key holding the shared seen-ID set
+            ttl: Expiry refreshed on writes so memory stays bounded
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+        """
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise RuntimeError(
+                "redis package is required for cross-process dedup. "
+                "Install it with: pip install redis"
+            )
+
+        self._redis = aioredis.from_url(redis_url)
+        self._key = key
+        self._ttl = ttl
+
+    async def is_new(self, news_id: str) -> bool:
+        """
+        Atomically record a news ID, reporting whether it was new.
+
+        Args:
+            news_id: The news item ID
+
+        Returns:
+            True if no replica had seen this ID before
+        """
+        added = await self._redis.sadd(self._key, news_id)
+        if added:
+            await self._redis.expire(self._key, self._ttl)
+        return added == 1
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        await self._redis.aclose()
@@ -2,12 +2,47 @@
 Data models for the CLS News Scraper and Analyzer.
 """
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _format_ts(ts: int) -> str:
+    """Format a Unix timestamp for display, memoized per second.
+
+    The fixed layout lets us skip strftime's locale machinery and
+    format the struct_time fields directly.
+    """
+    t = time.localtime(ts)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+        f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    )
+
+
+# Module-local binding skips the datetime attribute lookup on every
+# publish_time/analyzed_at access
+_fromtimestamp = datetime.fromtimestamp
+
+# Indexed by is_positive; avoids re-evaluating the ternary per __str__ call
+_SENTIMENT = ("利空", "利好")
+
+
+def _extract_names(items, _isinstance=isinstance) -> List[str]:
+    """Pull name strings out of a mixed list of dicts and strings."""
+    if not items:
+        return []
+    return [
+        it["name"] if _isinstance(it, dict) else it
+        for it in items
+        if not _isinstance(it, dict) or "name" in it
+    ]
+
+
+@dataclass(slots=True)
 class NewsItem:
     """Represents a single news item from CLS."""
     
@@ -17,45 +52,42 @@ class NewsItem:
     ctime: int  # Unix timestamp
     subjects: List[str] = field(default_factory=list)
     stocks: List[str] = field(default_factory=list)
-    
+    _display_time: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the display string; it is read by every prompt build."""
+        self._display_time = _format_ts(self.ctime)
+
     @property
     def publish_time(self) -> datetime:
         """Convert Unix timestamp to datetime."""
-        return datetime.fromtimestamp(self.ctime)
-    
+        return _fromtimestamp(self.ctime)
+
     @property
     def display_time(self) -> str:
-        """Format time for display."""
-        return self.publish_time.strftime("%Y-%m-%d %H:%M:%S")
+        """Formatted publish time, computed once at construction."""
+        return self._display_time
+
+    @property
+    def has_specific_stocks(self) -> bool:
+        """Whether the item names specific stocks."""
+        return bool(self.stocks)
+
+    @property
+    def is_industry_event(self) -> bool:
+        """Whether the item is tagged with subjects but no specific stocks."""
+        return bool(self.subjects) and not self.stocks
     
     @classmethod
     def from_api_response(cls, data: dict) -> "NewsItem":
         """Create NewsItem from API response data."""
-        # Extract stock codes from the response
-        stocks = []
-        if "stocks" in data and data["stocks"]:
-            for stock in data["stocks"]:
-                if isinstance(stock, dict) and "name" in stock:
-                    stocks.append(stock["name"])
-                elif isinstance(stock, str):
-                    stocks.append(stock)
-        
-        # Extract subjects/tags
-        subjects = []
-        if "subjects" in data and data["subjects"]:
-            for subject in data["subjects"]:
-                if isinstance(subject, dict) and "name" in subject:
-                    subjects.append(subject["name"])
-                elif isinstance(subject, str):
-                    subjects.append(subject)
-        
         return cls(
             id=str(data.get("id", "")),
             title=data.get("title", ""),
-            content=data.get("content", data.get("digest", "")),
+            content=data.get("content") or data.get("digest", ""),
             ctime=data.get("ctime", 0),
-            subjects=subjects,
-            stocks=stocks,
+            subjects=_extract_names(data.get("subjects")),
+            stocks=_extract_names(data.get("stocks")),
         )
     
     def __str__(self) -> str:
@@ -63,18 +95,61 @@ class NewsItem:
         return f"[{self.display_time}] {self.title or self.content[:50]}"
 
 
-@dataclass
+@dataclass(slots=True)
+class StockRating:
+    """Per-stock rating extracted from an analysis response."""
+
+    stock_name: str
+    is_positive: bool
+    score: int  # 1-10 rating
+    reason: str
+
+    def __str__(self) -> str:
+        """String representation of the stock rating."""
+        sentiment = _SENTIMENT[self.is_positive]
+        return f"{self.stock_name}: {sentiment} {self.score}/10 | {self.reason}"
+
+
+@dataclass(slots=True)
+class IndustryRating:
+    """Industry-level rating extracted from an analysis response."""
+
+    industry_name: str
+    is_positive: bool
+    score: int  # 1-10 rating
+    leader_stocks: List[str]
+    reason: str
+
+    def __str__(self) -> str:
+        """String representation of the industry rating."""
+        sentiment = _SENTIMENT[self.is_positive]
+        leaders = "、".join(self.leader_stocks) or "暂无"
+        return f"{self.industry_name}: {sentiment} {self.score}/10 | 龙头: {leaders}"
+
+
+@dataclass(slots=True)
 class AnalysisResult:
     """Analysis result for a news item."""
-    
+
     news_id: str
     score: int  # 1-10 rating
     analysis: str
     is_positive: bool
     market_impact: str
-    analyzed_at: datetime = field(default_factory=datetime.now)
+    # None until ratings are actually parsed; most results carry none,
+    # so the empty lists would be allocated only to sit unread
+    stock_ratings: Optional[List[StockRating]] = None
+    industry_ratings: Optional[List[IndustryRating]] = None
+    # Stored as a raw timestamp; building a datetime per result is
+    # wasted work when the field is rarely read
+    analyzed_at_ts: float = field(default_factory=time.time)
+
+    @property
+    def analyzed_at(self) -> datetime:
+        """Analysis time as a datetime, built on demand."""
+        return _fromtimestamp(self.analyzed_at_ts)
     
     def __str__(self) -> str:
         """String representation of analysis result."""
-        sentiment = "利好" if self.is_positive else "利空"
+        sentiment = _SENTIMENT[self.is_positive]
         return f"评分: {self.score}/10 | {sentiment} | {self.market_impact}"
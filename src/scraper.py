@@ -8,12 +8,16 @@ This module handles fetching news from the CLS Telegraph API with:
 - Proper error handling
 """
 
+import asyncio
+import functools
 import hashlib
 import logging
 import random
 import time
+from collections import deque
 from typing import List, Optional
 
+import httpx
 import requests
 from tenacity import (
     retry,
@@ -23,12 +27,103 @@ from tenacity import (
 )
 
 from .config import config
+from .dedup import BloomFilter
 from .models import NewsItem
 
+try:
+    # C-level JSON decode for the large roll_data arrays
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # msgspec parses the API payload straight into typed objects in C,
+    # skipping the intermediate dict tree entirely
+    import msgspec
+
+    class _ApiStock(msgspec.Struct, gc=False):
+        name: str = ""
+
+    class _ApiRollItem(msgspec.Struct, gc=False):
+        id: int = 0
+        title: Optional[str] = None
+        content: Optional[str] = None
+        digest: Optional[str] = None
+        ctime: int = 0
+        subjects: Optional[List[_ApiStock]] = None
+        stocks: Optional[List[_ApiStock]] = None
+
+    class _ApiData(msgspec.Struct, gc=False):
+        roll_data: List[_ApiRollItem] = []
+
+    class _ApiResponse(msgspec.Struct, gc=False):
+        errno: int = 0
+        errmsg: str = ""
+        data: Optional[_ApiData] = None
+
+    _api_decoder = msgspec.json.Decoder(_ApiResponse)
+except ImportError:
+    msgspec = None
+    _api_decoder = None
+
 
 logger = logging.getLogger(__name__)
 
 
+def _load_json(response) -> dict:
+    """Decode a JSON response body, preferring orjson over the stdlib."""
+    raw = response.content
+    if orjson is not None and isinstance(raw, (bytes, bytearray)):
+        return orjson.loads(raw)
+    return response.json()
+
+
+@functools.lru_cache(maxsize=1024)
+def _generate_sign_impl(params_str: str) -> str:
+    """SHA1-then-MD5 signature, memoized since poll params repeat."""
+    # The hex digest is pure ASCII; encoding it as such skips the
+    # UTF-8 codec's multi-byte handling on the re-hash
+    sha1_hex = hashlib.sha1(params_str.encode("utf-8")).hexdigest().encode("ascii")
+    return hashlib.md5(sha1_hex).hexdigest()
+
+
+def _decode_news_items(raw) -> Optional[List[NewsItem]]:
+    """
+    Decode the raw API payload into NewsItems via msgspec, if available.
+
+    Args:
+        raw: The response body bytes
+
+    Returns:
+        The decoded items (empty on API error), or None when msgspec is
+        missing or the payload does not match the expected shape — the
+        caller then falls back to the dict-based parsing path
+    """
+    if _api_decoder is None or not isinstance(raw, (bytes, bytearray)):
+        return None
+
+    try:
+        resp = _api_decoder.decode(raw)
+    except msgspec.DecodeError:
+        return None
+
+    if resp.errno != 0 or resp.data is None:
+        logger.error(f"API returned error: {resp.errmsg or 'Unknown error'}")
+        return []
+
+    return [
+        NewsItem(
+            id=str(item.id),
+            title=item.title or "",
+            content=item.content or item.digest or "",
+            ctime=item.ctime,
+            subjects=[s.name for s in item.subjects or [] if s.name],
+            stocks=[s.name for s in item.stocks or [] if s.name],
+        )
+        for item in resp.data.roll_data
+    ]
+
+
 # User agents pool for rotation
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -54,8 +149,32 @@ class CLSScraper:
     def __init__(self):
         """Initialize the scraper."""
         self._session = requests.Session()
-        self._last_news_id: Optional[str] = None
+        # Two-layer duplicate detection: an exact set over the most
+        # recent IDs catches the common consecutive-poll duplicate with
+        # one hashed lookup (no false positives), while the Bloom
+        # filter remembers the long tail in bounded memory
+        self._seen_ids: set = set()
+        self._seen_order: deque = deque(maxlen=10_000)
+        self._seen = BloomFilter(capacity=100_000, error_rate=0.001)
+        # Refilled in bulk; drawing agents one at a time pays RNG
+        # overhead per request
+        self._ua_pool: List[str] = []
+        # Created lazily on the running event loop by the async path
+        self._async_client: Optional[httpx.AsyncClient] = None
         self._setup_session()
+
+    @property
+    def seen_count(self) -> int:
+        """Approximate number of distinct news items seen so far."""
+        return self._seen.approximate_count()
+
+    def _remember(self, news_id: str) -> None:
+        """Record a news ID in both dedup layers, evicting FIFO from the exact set."""
+        if len(self._seen_order) == self._seen_order.maxlen:
+            self._seen_ids.discard(self._seen_order[0])
+        self._seen_order.append(news_id)
+        self._seen_ids.add(news_id)
+        self._seen.add(news_id)
     
     def _setup_session(self) -> None:
         """Set up the requests session with default headers."""
@@ -69,8 +188,10 @@ class CLSScraper:
         })
     
     def _get_random_user_agent(self) -> str:
-        """Get a random user agent from the pool."""
-        return random.choice(USER_AGENTS)
+        """Get a random user agent, drawn from a batch-filled buffer."""
+        if not self._ua_pool:
+            self._ua_pool = random.choices(USER_AGENTS, k=256)
+        return self._ua_pool.pop()
     
     @staticmethod
     def _generate_sign(params_str: str) -> str:
@@ -87,9 +208,7 @@ class CLSScraper:
         Returns:
             The hexadecimal signature string
         """
-        sha1_hash = hashlib.sha1(params_str.encode("utf-8")).hexdigest()
-        md5_hash = hashlib.md5(sha1_hash.encode("utf-8")).hexdigest()
-        return md5_hash
+        return _generate_sign_impl(params_str)
     
     def _build_api_url(
         self, last_time: Optional[int] = None, count: Optional[int] = None
@@ -106,58 +225,50 @@ class CLSScraper:
         """
         if last_time is None:
             last_time = int(time.time())
-        
+
         if count is None:
             count = config.fetch_count
-        
-        # Build parameter string (order matters for signature)
-        params = {
-            "app": config.cls_app,
-            "last_time": last_time,
-            "os": config.cls_os,
-            "rn": count,
-            "sv": config.cls_sv,
-        }
-        
-        # Create parameter string for signature
-        params_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
-        
-        # Generate signature
+
+        # Parameter string built directly in sorted key order (the
+        # order the signature requires); no dict/sort/join round trip
+        params_str = (
+            f"app={config.cls_app}&last_time={last_time}"
+            f"&os={config.cls_os}&rn={count}&sv={config.cls_sv}"
+        )
+
         sign = self._generate_sign(params_str)
-        
-        # Build complete URL
-        url = f"{config.cls_api_url}?{params_str}&sign={sign}"
-        return url
+
+        return f"{config.cls_api_url}?{params_str}&sign={sign}"
     
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=10),
         retry=retry_if_exception_type((requests.RequestException, ConnectionError)),
     )
-    def _make_request(self, url: str) -> dict:
+    def _make_request(self, url: str) -> requests.Response:
         """
         Make an HTTP request with retry logic.
-        
+
         Args:
             url: The URL to fetch
-            
+
         Returns:
-            The JSON response as a dictionary
-            
+            The HTTP response
+
         Raises:
             requests.RequestException: If the request fails after retries
         """
         self._session.headers["User-Agent"] = self._get_random_user_agent()
-        
+
         logger.debug(f"Fetching URL: {url}")
-        
+
         response = self._session.get(
             url,
             timeout=config.request_timeout,
         )
         response.raise_for_status()
-        
-        return response.json()
+
+        return response
     
     def fetch_latest_news(self) -> Optional[NewsItem]:
         """
@@ -168,31 +279,38 @@ class CLSScraper:
         """
         try:
             url = self._build_api_url()
-            data = self._make_request(url)
-            
-            # Parse response
-            if data.get("errno") != 0:
-                logger.error(f"API returned error: {data.get('errmsg', 'Unknown error')}")
-                return None
-            
-            news_list = data.get("data", {}).get("roll_data", [])
-            
-            if not news_list:
-                logger.warning("No news items returned from API")
-                return None
-            
-            # Get the latest news item
-            latest = news_list[0]
-            news_item = NewsItem.from_api_response(latest)
-            
-            # Check for duplicates
-            if news_item.id == self._last_news_id:
+            response = self._make_request(url)
+
+            # Typed C-level decode first; dict parsing as fallback
+            items = _decode_news_items(response.content)
+            if items is not None:
+                if not items:
+                    logger.warning("No news items returned from API")
+                    return None
+                news_item = items[0]
+            else:
+                data = _load_json(response)
+
+                if data.get("errno") != 0:
+                    logger.error(f"API returned error: {data.get('errmsg', 'Unknown error')}")
+                    return None
+
+                news_list = data.get("data", {}).get("roll_data", [])
+
+                if not news_list:
+                    logger.warning("No news items returned from API")
+                    return None
+
+                news_item = NewsItem.from_api_response(news_list[0])
+
+            # Check for duplicates (exact recent window first)
+            if news_item.id in self._seen_ids or news_item.id in self._seen:
                 logger.debug(f"Duplicate news item detected: {news_item.id}")
                 return None
-            
-            # Update last seen ID
-            self._last_news_id = news_item.id
-            
+
+            # Remember the item
+            self._remember(news_item.id)
+
             logger.info(f"Fetched new news: {news_item}")
             return news_item
             
@@ -203,6 +321,73 @@ class CLSScraper:
             logger.error(f"Failed to parse API response: {e}")
             return None
     
+    async def fetch_latest_news_async(self) -> Optional[NewsItem]:
+        """
+        Async variant of :meth:`fetch_latest_news`.
+
+        The blocking HTTP request runs in a worker thread so the event
+        loop stays responsive while waiting on the network.
+
+        Returns:
+            The latest NewsItem if new, None if same as last fetch or error
+        """
+        return await asyncio.to_thread(self.fetch_latest_news)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Build (once) the pooled HTTP/2 client for the async fetch path."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                timeout=config.request_timeout,
+                headers=dict(self._session.headers),
+            )
+        return self._async_client
+
+    async def fetch_multiple_news_async(self, count: int = 20) -> List[NewsItem]:
+        """
+        Fetch multiple news items without blocking the event loop.
+
+        Unlike the thread-hopping wrapper around the sync path, this
+        goes through a pooled httpx.AsyncClient with HTTP/2 and
+        keep-alive, so concurrent fetches multiplex over one
+        connection.
+
+        Args:
+            count: Number of items to fetch
+
+        Returns:
+            List of NewsItem objects
+        """
+        try:
+            url = self._build_api_url(count=count)
+            client = self._get_async_client()
+
+            response = await client.get(
+                url, headers={"User-Agent": self._get_random_user_agent()}
+            )
+            response.raise_for_status()
+
+            items = _decode_news_items(response.content)
+            if items is not None:
+                return items
+
+            data = _load_json(response)
+
+            if data.get("errno") != 0:
+                logger.error(f"API returned error: {data.get('errmsg', 'Unknown error')}")
+                return []
+
+            news_list = data.get("data", {}).get("roll_data", [])
+
+            return [NewsItem.from_api_response(item) for item in news_list]
+
+        except httpx.HTTPError as e:
+            logger.error(f"Async fetch failed: {e}")
+            return []
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(f"Failed to parse API response: {e}")
+            return []
+
     def fetch_multiple_news(self, count: int = 20) -> List[NewsItem]:
         """
         Fetch multiple news items.
@@ -215,15 +400,21 @@ class CLSScraper:
         """
         try:
             url = self._build_api_url(count=count)
-            
-            data = self._make_request(url)
-            
+
+            response = self._make_request(url)
+
+            items = _decode_news_items(response.content)
+            if items is not None:
+                return items
+
+            data = _load_json(response)
+
             if data.get("errno") != 0:
                 logger.error(f"API returned error: {data.get('errmsg', 'Unknown error')}")
                 return []
-            
+
             news_list = data.get("data", {}).get("roll_data", [])
-            
+
             return [NewsItem.from_api_response(item) for item in news_list]
             
         except Exception as e:
@@ -233,6 +424,13 @@ class CLSScraper:
     def close(self) -> None:
         """Close the session."""
         self._session.close()
+
+    async def aclose(self) -> None:
+        """Close both the sync session and the async client, if created."""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
     
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,122 @@
+"""
+Tests for the AI provider package.
+"""
+
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+from src.ai_providers import (
+    GitHubCopilotProvider,
+    QiniuCloudProvider,
+    create_ai_provider,
+)
+
+
+class TestCreateAIProvider(unittest.TestCase):
+    """Test cases for the provider factory."""
+
+    def test_create_qiniu_provider(self):
+        """Test that the factory builds a Qiniu provider."""
+        provider = create_ai_provider("qiniu", api_key="test-key")
+
+        self.assertIsInstance(provider, QiniuCloudProvider)
+        self.assertTrue(provider.available)
+
+    def test_create_copilot_provider(self):
+        """Test that the factory builds a Copilot provider."""
+        provider = create_ai_provider("copilot")
+
+        self.assertIsInstance(provider, GitHubCopilotProvider)
+
+    def test_unknown_provider_raises(self):
+        """Test that unknown provider names are rejected."""
+        with self.assertRaises(ValueError):
+            create_ai_provider("nonexistent")
+
+
+class TestQiniuCloudProvider(unittest.TestCase):
+    """Test cases for QiniuCloudProvider."""
+
+    def _mock_response(self, content):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
+            {"choices": [{"message": {"content": content}}]}
+        ).encode("utf-8")
+        return mock_response
+
+    def test_unavailable_without_api_key(self):
+        """Test that the provider reports unavailable without a key."""
+        provider = QiniuCloudProvider(api_key=None)
+
+        self.assertFalse(provider.available)
+
+    @patch("httpx.Client.post")
+    def test_analyze_returns_content(self, mock_post):
+        """Test that analyze extracts the completion content."""
+        mock_post.return_value = self._mock_response("评分：8")
+
+        provider = QiniuCloudProvider(api_key="test-key")
+        result = provider.analyze("测试提示词")
+
+        self.assertEqual(result, "评分：8")
+
+    @patch("src.ai_providers.qiniu_provider.time.sleep")
+    @patch("httpx.Client.post")
+    def test_analyze_retries_transient_errors(self, mock_post, mock_sleep):
+        """Test that throttled requests are retried with backoff."""
+        throttled = MagicMock()
+        throttled.status_code = 503
+        throttled.headers = {"Retry-After": "1"}
+        mock_post.side_effect = [throttled, self._mock_response("评分：6")]
+
+        provider = QiniuCloudProvider(api_key="test-key")
+        result = provider.analyze("限流测试")
+
+        self.assertEqual(result, "评分：6")
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch("httpx.Client.post")
+    def test_analyze_caches_identical_prompts(self, mock_post):
+        """Test that a repeated prompt is served from the cache."""
+        mock_post.return_value = self._mock_response("评分：8")
+
+        provider = QiniuCloudProvider(api_key="test-key")
+        first = provider.analyze("测试提示词")
+        second = provider.analyze("测试提示词")
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(provider.cache_hits, 1)
+        self.assertEqual(provider.cache_misses, 1)
+
+    @patch("httpx.Client.post")
+    def test_analyze_batch_parses_json_array(self, mock_post):
+        """Test that a batch call splits the JSON array answer."""
+        answers = ["回答一", "回答二"]
+        mock_post.return_value = self._mock_response(json.dumps(answers))
+
+        provider = QiniuCloudProvider(api_key="test-key")
+        results = provider.analyze_batch(["提示一", "提示二"])
+
+        self.assertEqual(results, answers)
+        # Both prompts went out in a single request
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch("httpx.Client.post")
+    def test_analyze_batch_falls_back_on_bad_json(self, mock_post):
+        """Test per-prompt fallback when the array cannot be parsed."""
+        mock_post.return_value = self._mock_response("not json at all")
+
+        provider = QiniuCloudProvider(api_key="test-key")
+        results = provider.analyze_batch(["提示一", "提示二"])
+
+        self.assertEqual(len(results), 2)
+        # One failed batch call plus one call per prompt
+        self.assertEqual(mock_post.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,6 +31,87 @@ class TestCopilotAnalyzer(unittest.TestCase):
         self.assertTrue(result.is_positive)
         self.assertIn("相关板块", result.market_impact)
     
+    def test_parse_stock_ratings(self):
+        """Test parsing of per-stock rating lines."""
+        analyzer = CopilotAnalyzer()
+
+        response_text = """
+评分：7
+影响：利好
+分析：新能源板块利好
+市场影响：板块走强
+- 宁德时代：利好 8/10 | 动力电池需求提升
+- 比亚迪：利空 3/10 | 价格战压缩利润
+"""
+
+        ratings = analyzer._parse_stock_ratings(response_text)
+
+        self.assertEqual(len(ratings), 2)
+        self.assertEqual(ratings[0].stock_name, "宁德时代")
+        self.assertTrue(ratings[0].is_positive)
+        self.assertEqual(ratings[0].score, 8)
+        self.assertFalse(ratings[1].is_positive)
+        self.assertEqual(ratings[1].score, 3)
+
+    def test_parse_industry_ratings(self):
+        """Test parsing of the industry rating block."""
+        analyzer = CopilotAnalyzer()
+
+        response_text = """
+评分：7
+影响：利好
+分析：行业层面利好
+市场影响：板块走强
+行业名称：新能源
+影响方向：利好
+评分：8/10
+龙头股票：宁德时代、比亚迪、隆基绿能
+第一性原理分析：补贴政策降低成本曲线
+"""
+
+        ratings = analyzer._parse_industry_ratings(response_text)
+
+        self.assertEqual(len(ratings), 1)
+        self.assertEqual(ratings[0].industry_name, "新能源")
+        self.assertTrue(ratings[0].is_positive)
+        self.assertEqual(ratings[0].score, 8)
+        self.assertEqual(len(ratings[0].leader_stocks), 3)
+
+    def test_parse_analysis_json(self):
+        """Test parsing of a structured JSON response."""
+        analyzer = CopilotAnalyzer()
+
+        response_text = (
+            '{"score": 9, "is_positive": true, "analysis": "重大政策利好",'
+            ' "market_impact": "推动板块上涨",'
+            ' "stock_ratings": [{"stock_name": "宁德时代", "is_positive": true,'
+            ' "score": 8, "reason": "需求提升"}],'
+            ' "industry_ratings": []}'
+        )
+
+        result = analyzer._parse_analysis_json("test-id", response_text)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result.score, 9)
+        self.assertTrue(result.is_positive)
+        self.assertEqual(len(result.stock_ratings), 1)
+        self.assertEqual(result.stock_ratings[0].stock_name, "宁德时代")
+
+    def test_parse_analysis_json_fenced(self):
+        """Test parsing of JSON wrapped in a markdown fence."""
+        analyzer = CopilotAnalyzer()
+
+        response_text = (
+            '以下是分析结果：\n```json\n{"score": 4, "is_positive": false,'
+            ' "analysis": "影响有限", "market_impact": "波动有限"}\n```'
+        )
+
+        result = analyzer._parse_analysis_json("test-id", response_text)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result.score, 4)
+        self.assertFalse(result.is_positive)
+
     def test_parse_analysis_response_invalid_score(self):
         """Test handling of invalid score values."""
         analyzer = CopilotAnalyzer()
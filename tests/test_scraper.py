@@ -7,6 +7,7 @@ import time
 import unittest
 from unittest.mock import patch, MagicMock
 
+from src.dedup import BloomFilter
 from src.scraper import CLSScraper
 from src.models import NewsItem
 
@@ -158,6 +159,38 @@ class TestCLSScraper(unittest.TestCase):
         scraper.close()
 
 
+class TestBloomFilter(unittest.TestCase):
+    """Test cases for the Bloom filter used for deduplication."""
+
+    def test_added_items_are_contained(self):
+        """Test that added items are reported as seen."""
+        bloom = BloomFilter(capacity=1000)
+
+        for i in range(100):
+            bloom.add(f"news-{i}")
+
+        for i in range(100):
+            self.assertIn(f"news-{i}", bloom)
+
+    def test_fresh_items_not_contained(self):
+        """Test that unseen items are not reported as seen."""
+        bloom = BloomFilter(capacity=1000)
+
+        bloom.add("news-1")
+
+        self.assertNotIn("news-2", bloom)
+
+    def test_approximate_count(self):
+        """Test the approximate distinct-item counter."""
+        bloom = BloomFilter(capacity=1000)
+
+        bloom.add("news-1")
+        bloom.add("news-2")
+        bloom.add("news-1")  # duplicate
+
+        self.assertEqual(bloom.approximate_count(), 2)
+
+
 class TestNewsItem(unittest.TestCase):
     """Test cases for NewsItem model."""
     